@@ -18,15 +18,58 @@ Example:
     ...     print(plugin.full_name)
 """
 
+import importlib
 import logging
+from typing import TYPE_CHECKING
 
-from .components import AudioComponent, AudioUnitType, Component
 from .exceptions import MusicAppsLoadError, PluginLoadError, TagsetLoadError
-from .logic import Logic, Plugins, SearchResult
-from .tags import Category, MusicApps, Properties, Tagpool, Tagset
+
+if TYPE_CHECKING:
+    from .components import AudioComponent, AudioUnitType, Component
+    from .logic import Logic, Plugins, SearchResult
+    from .tags import Category, MusicApps, Properties, Tagpool, Tagset
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
+_LAZY_EXPORTS = {
+    "AudioComponent": ".components",
+    "AudioUnitType": ".components",
+    "Component": ".components",
+    "Logic": ".logic",
+    "Plugins": ".logic",
+    "SearchResult": ".logic",
+    "Category": ".tags",
+    "MusicApps": ".tags",
+    "Properties": ".tags",
+    "Tagpool": ".tags",
+    "Tagset": ".tags",
+}
+"""dict[str, str]: Public names mapped to the subpackage that defines them.
+
+The subpackages are imported on first attribute access (PEP 562), so
+importing only the exceptions does not load the plugin and tag machinery.
+"""
+
+
+_LAZY_SUBMODULES = frozenset({"components", "defaults", "logic", "tags"})
+"""frozenset[str]: Submodules that are importable as attributes of the package."""
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _LAZY_SUBMODULES)
+
+
 __all__ = [
     "AudioComponent",
     "AudioUnitType",
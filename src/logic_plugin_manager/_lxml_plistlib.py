@@ -0,0 +1,251 @@
+"""XML plist reader backed by lxml.
+
+This module mirrors plistlib's XML parser, but drives it from lxml's iterparse
+so that tokenizing happens in libxml2 rather than in Python. Only reading of
+XML plists is implemented; binary plists are dispatched by the caller.
+
+Importing this module raises ImportError when lxml is not installed.
+"""
+
+import binascii
+import datetime
+import io
+import plistlib
+import re
+
+from lxml import etree
+
+_date_parser = re.compile(
+    r"(?P<year>\d\d\d\d)"
+    r"(?:-(?P<month>\d\d)"
+    r"(?:-(?P<day>\d\d)"
+    r"(?:T(?P<hour>\d\d)"
+    r"(?::(?P<minute>\d\d)"
+    r"(?::(?P<second>\d\d))"
+    r"?)?)?)?)?Z",
+    re.ASCII,
+)
+
+
+def _date_from_string(s: str) -> datetime.datetime:
+    order = ("year", "month", "day", "hour", "minute", "second")
+    groups = _date_parser.match(s).groupdict()
+    lst = []
+    for key in order:
+        value = groups[key]
+        if value is None:
+            break
+        lst.append(int(value))
+    return datetime.datetime(*lst)
+
+
+def _integer(text: str) -> int:
+    if text.startswith(("0x", "0X")):
+        return int(text, 16)
+    return int(text)
+
+
+def _collect(node, parts: list[str]) -> list[str]:
+    for child in node:
+        if isinstance(child.tag, str):
+            # plistlib drops the text collected so far at every start tag.
+            parts = _collect(child, [child.text or ""])
+        parts.append(child.tail or "")
+    return parts
+
+
+def _text(elem) -> str:
+    # Comments, processing instructions and undeclared entity references are
+    # child nodes in lxml; plistlib skips them but keeps the text around them.
+    if not len(elem):
+        return elem.text or ""
+    return "".join(_collect(elem, [elem.text or ""]))
+
+
+def _check_entities(elem):
+    dtd = elem.getroottree().docinfo.internalDTD
+    if dtd is not None and any(True for _ in dtd.iterentities()):
+        raise plistlib.InvalidFileException(
+            "XML entity declarations are not supported in plist files"
+        )
+
+
+_scalars = {
+    "string": lambda text: text,
+    "integer": _integer,
+    "real": float,
+    "true": lambda text: True,
+    "false": lambda text: False,
+    "data": lambda text: binascii.a2b_base64(text.encode("utf-8")),
+    "date": _date_from_string,
+}
+
+
+class _Builder:
+    """Incremental plist object builder fed with lxml iterparse events.
+
+    If stream_key is set and the root is a dict, the items of the array stored
+    under that key are not kept in the tree. Each one is appended to
+    ``streamed`` as soon as it is complete, leaving the array in the root empty.
+    """
+
+    __slots__ = ("stack", "current_key", "root", "stream_key", "target", "streamed")
+
+    def __init__(self, stream_key: str | None = None):
+        self.stack: list[dict | list] = []
+        self.current_key: str | None = None
+        self.root = None
+        self.stream_key = stream_key
+        self.target: list | None = None
+        self.streamed: list = []
+
+    def add_object(self, value, elem):
+        stack = self.stack
+        if self.current_key is not None:
+            if not isinstance(stack[-1], dict):
+                raise plistlib.InvalidFileException(
+                    f"unexpected element at line {elem.sourceline}"
+                )
+            stack[-1][self.current_key] = value
+            self.current_key = None
+        elif not stack:
+            self.root = value
+        else:
+            if not isinstance(stack[-1], list):
+                raise plistlib.InvalidFileException(
+                    f"unexpected element at line {elem.sourceline}"
+                )
+            stack[-1].append(value)
+
+    def feed(self, event: str, elem):
+        stack = self.stack
+        tag = elem.tag
+        if event == "start":
+            if not stack and self.root is None:
+                _check_entities(elem)
+            if tag == "dict":
+                value = {}
+            elif tag == "array":
+                value = []
+                if (
+                    self.stream_key is not None
+                    and len(stack) == 1
+                    and self.current_key == self.stream_key
+                ):
+                    self.target = value
+            else:
+                return
+            self.add_object(value, elem)
+            stack.append(value)
+            return
+
+        if tag == "dict":
+            if self.current_key:
+                raise plistlib.InvalidFileException(
+                    f"missing value for key {self.current_key!r} "
+                    f"at line {elem.sourceline}"
+                )
+            stack.pop()
+        elif tag == "array":
+            stack.pop()
+        elif tag == "key":
+            if self.current_key or not stack or not isinstance(stack[-1], dict):
+                raise plistlib.InvalidFileException(
+                    f"unexpected key at line {elem.sourceline}"
+                )
+            self.current_key = _text(elem)
+        elif tag in _scalars:
+            self.add_object(_scalars[tag](_text(elem)), elem)
+        else:
+            # Like plistlib, ignore elements without a handler (including
+            # <plist> itself). Their text stays in the tree for an enclosing
+            # scalar to pick up.
+            return
+        elem.clear(keep_tail=True)
+
+        if len(stack) == 2 and stack[1] is self.target and self.target:
+            self.streamed.append(self.target.pop())
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+def _iterparse(fp):
+    return etree.iterparse(
+        fp,
+        events=("start", "end"),
+        resolve_entities=False,
+        no_network=True,
+    )
+
+
+def load(fp):
+    """Parse XML plist data from a binary file object.
+
+    Args:
+        fp: File object opened in binary mode.
+
+    Returns:
+        Parsed plist root object (usually a dict).
+
+    Raises:
+        plistlib.InvalidFileException: If the XML is not a well-formed plist
+            or declares entities.
+        lxml.etree.XMLSyntaxError: If the file is not well-formed XML.
+    """
+    builder = _Builder()
+    for event, elem in _iterparse(fp):
+        builder.feed(event, elem)
+    return builder.root
+
+
+def iterload(fp, key: str, rest: dict):
+    """Parse XML plist data, yielding the items of one root array as they end.
+
+    Only one item of the array is held at a time, and its XML subtree is
+    discarded once it has been yielded. The remaining root entries are
+    written into rest as parsing goes on, so rest is only complete once the
+    generator is exhausted. If the array is present, rest[key] is left as an
+    empty list.
+
+    Args:
+        fp: File object opened in binary mode.
+        key: Root dict key of the array to stream.
+        rest: Dictionary that receives the other root entries.
+
+    Yields:
+        Items of the array stored under key, in document order.
+
+    Raises:
+        plistlib.InvalidFileException: If the XML is not a well-formed plist,
+            declares entities, or its root is not a dict.
+        lxml.etree.XMLSyntaxError: If the file is not well-formed XML.
+    """
+    builder = _Builder(key)
+    for event, elem in _iterparse(fp):
+        builder.feed(event, elem)
+        if builder.streamed:
+            yield from builder.streamed
+            builder.streamed.clear()
+    if not isinstance(builder.root, dict):
+        raise plistlib.InvalidFileException("plist root is not a dict")
+    rest.update(builder.root)
+
+
+def loads(data: bytes):
+    """Parse XML plist data from bytes.
+
+    Args:
+        data: Complete XML plist document.
+
+    Returns:
+        Parsed plist root object (usually a dict).
+
+    Raises:
+        plistlib.InvalidFileException: If the XML is not a well-formed plist
+            or declares entities.
+        lxml.etree.XMLSyntaxError: If the data is not well-formed XML.
+    """
+    return load(io.BytesIO(data))
+
+
+__all__ = ["iterload", "load", "loads"]
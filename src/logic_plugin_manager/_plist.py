@@ -0,0 +1,206 @@
+"""Shared plist reading and writing helpers.
+
+This module wraps plistlib with a small in-process cache so that repeated
+reads of an unchanged plist file skip parsing entirely. Cache entries are
+keyed by path and validated against the file's modification time and size,
+so any external change to the file is picked up on the next read. Only the
+most recently read files are kept (see _CACHE_SIZE). The cache is meant for
+the few files that many objects re-read, such as the MusicApps database;
+one-off reads go through read() instead.
+
+Binary plists are recognized by their header and decoded directly by
+plistlib's binary reader. XML plists are parsed with lxml when it is
+installed (see _lxml_plistlib), falling back to plistlib otherwise and for
+small documents (see _LXML_MIN_SIZE). Both plistlib and lxml are imported on
+first use rather than at import time.
+"""
+
+import copy
+import functools
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import plistlib
+
+_BINARY_MAGIC = b"bplist00"
+
+_LXML_MIN_SIZE = 1024
+"""int: XML plists smaller than this many bytes are parsed with plistlib.
+
+lxml's per-document setup costs more than it saves below about 500 bytes,
+which covers most .tagset files.
+"""
+
+_CACHE_SIZE = 16
+"""int: Maximum number of parsed plists kept in the cache."""
+
+_cache: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+
+
+@functools.cache
+def _reader():
+    try:
+        from . import _lxml_plistlib as reader
+    except ImportError:
+        import plistlib as reader
+    return reader
+
+
+def _stamp(path: Path) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def stamp(path: Path) -> tuple[int, int] | None:
+    """Get a cheap change marker for a file.
+
+    Args:
+        path: Path to file.
+
+    Returns:
+        tuple[int, int] | None: (st_mtime_ns, st_size), or None if the file
+            cannot be stat'ed.
+    """
+    try:
+        return _stamp(path)
+    except OSError:
+        return None
+
+
+def parse(data: bytes) -> dict:
+    """Parse plist data from the raw contents of a plist file.
+
+    Args:
+        data: Complete file contents.
+
+    Returns:
+        dict: Parsed plist data.
+    """
+    if data.startswith(_BINARY_MAGIC):
+        import plistlib
+
+        return plistlib.loads(data, fmt=plistlib.FMT_BINARY)
+    if len(data) < _LXML_MIN_SIZE:
+        import plistlib
+
+        return plistlib.loads(data, fmt=plistlib.FMT_XML)
+    return _reader().loads(data)
+
+
+def read(path: Path) -> dict:
+    """Read and parse a plist file without caching.
+
+    Args:
+        path: Path to plist file.
+
+    Returns:
+        dict: Parsed plist data.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        OSError: If the file cannot be read.
+        plistlib.InvalidFileException: If the file is not a valid plist.
+    """
+    with open(path, "rb") as fp:
+        return parse(fp.read())
+
+
+def load(path: Path, stamp: tuple[int, int] | None = None) -> dict:
+    """Load a plist file, reusing the cached result if the file is unchanged.
+
+    Args:
+        path: Path to plist file.
+        stamp: The file's stamp() if the caller already took it, so the file
+            is not stat'ed twice. Taken here if None.
+
+    Returns:
+        dict: Parsed plist data. A fresh copy is returned on every call, so
+            callers are free to mutate it.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        OSError: If the file cannot be read.
+        plistlib.InvalidFileException: If the file is not a valid plist.
+    """
+    key = str(path)
+    if stamp is None:
+        stamp = _stamp(path)
+    cached = _cache.get(key)
+    if cached is not None and cached[:2] == stamp:
+        _cache.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    data = read(path)
+    _cache[key] = (*stamp, data)
+    _cache.move_to_end(key)
+    if len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+def iterload(path: Path, key: str, rest: dict):
+    """Stream the items of one array from a plist file's root dict.
+
+    XML plists are streamed with lxml when it is installed, so only one item
+    is parsed and held at a time. Binary plists, and XML without lxml, are
+    parsed in full first. Results are not cached.
+
+    Args:
+        path: Path to plist file.
+        key: Root dict key of the array to stream.
+        rest: Dictionary that receives the other root entries. It is only
+            complete once the generator is exhausted. If the array is
+            present, rest[key] is left as an empty list.
+
+    Yields:
+        Items of the array stored under key, in order.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        OSError: If the file cannot be read.
+        plistlib.InvalidFileException: If the file is not a valid plist.
+    """
+    with open(path, "rb") as fp:
+        reader = _reader()
+        if hasattr(reader, "iterload") and fp.read(8) != _BINARY_MAGIC:
+            fp.seek(0)
+            yield from reader.iterload(fp, key, rest)
+            return
+        fp.seek(0)
+        data = parse(fp.read())
+
+    rest.update(data)
+    items = rest.get(key)
+    if isinstance(items, list):
+        rest[key] = []
+        yield from items
+
+
+def dump(path: Path, data: dict, *, fmt: "plistlib.PlistFormat | None" = None):
+    """Write data to a plist file.
+
+    The write changes the file's modification time, so the next load() picks
+    up the new content without any explicit invalidation.
+
+    Args:
+        path: Path to plist file.
+        data: Dictionary to serialize and write.
+        fmt: Output format, plistlib.FMT_XML (the default if None) or
+            plistlib.FMT_BINARY.
+
+    Raises:
+        OSError: If the file cannot be written.
+        TypeError: If data contains non-serializable types.
+    """
+    import plistlib
+
+    if fmt is None:
+        fmt = plistlib.FMT_XML
+    with open(path, "wb") as fp:
+        plistlib.dump(data, fp, fmt=fmt)
+
+
+__all__ = ["dump", "iterload", "load", "parse", "read", "stamp"]
@@ -4,6 +4,7 @@ This module provides classes for working with macOS Audio Unit components,
 including parsing component metadata and managing their tags and categories.
 """
 
+import functools
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
@@ -65,11 +66,7 @@ class AudioUnitType(Enum):
         Returns:
             AudioUnitType | None: Matching AudioUnitType or None if not found.
         """
-        code_lower = code.lower()
-        for unit_type in cls:
-            if unit_type.code == code_lower:
-                return unit_type
-        return None
+        return _CODE_INDEX.get(code.lower())
 
     @classmethod
     def search(cls, query: str) -> list["AudioUnitType"]:
@@ -83,19 +80,81 @@ class AudioUnitType(Enum):
         Returns:
             list[AudioUnitType]: List of matching AudioUnitType values.
         """
-        query_lower = query.lower()
-        results = []
-        for unit_type in cls:
-            if (
-                query_lower in unit_type.code
-                or query_lower in unit_type.display_name.lower()
-                or query_lower in unit_type.alt_name.lower()
-            ):
-                results.append(unit_type)
-        return results
-
-
-@dataclass
+        return list(_SEARCH_INDEX.get(query.lower(), ()))
+
+
+_CODE_INDEX: dict[str, AudioUnitType] = {
+    unit_type.code: unit_type for unit_type in AudioUnitType
+}
+"""dict: AudioUnitType members keyed by their four-character code."""
+
+
+def _build_search_index() -> dict[str, tuple[AudioUnitType, ...]]:
+    """Map every substring of every searchable field to the matching types.
+
+    The enum is small and fixed, so enumerating all substrings of the
+    lowercased code, display_name and alt_name fields (a few hundred keys)
+    turns AudioUnitType.search into a single dict lookup.
+
+    Returns:
+        dict[str, tuple[AudioUnitType, ...]]: Matching types in definition
+            order, keyed by lowercased substring.
+    """
+    index: dict[str, list[AudioUnitType]] = {}
+    for unit_type in AudioUnitType:
+        fields = (
+            unit_type.code,
+            unit_type.display_name.lower(),
+            unit_type.alt_name.lower(),
+        )
+        substrings = {
+            text[start:end]
+            for text in fields
+            for start in range(len(text) + 1)
+            for end in range(start, len(text) + 1)
+        }
+        for substring in substrings:
+            index.setdefault(substring, []).append(unit_type)
+    return {substring: tuple(types) for substring, types in index.items()}
+
+
+_SEARCH_INDEX: dict[str, tuple[AudioUnitType, ...]] = _build_search_index()
+"""dict: AudioUnitType members keyed by lowercased field substrings."""
+
+
+@functools.cache
+def _tags_id(type_code: str, subtype_code: str, manufacturer_code: str) -> str:
+    """Build the tagset identifier for a type/subtype/manufacturer triple.
+
+    The identifier is the hex encoding of each ASCII code, joined with '-'.
+    For the usual four-character codes the three codes are hex-encoded in a
+    single bytes.hex() call that inserts the separators itself. Results are
+    memoized, since the same triples come back whenever bundles are rescanned
+    or reloaded.
+
+    Args:
+        type_code: Four-character Audio Unit type code.
+        subtype_code: Four-character subtype code.
+        manufacturer_code: Four-character manufacturer code.
+
+    Returns:
+        str: Identifier such as '61756678-706c3031-41636d65'.
+
+    Raises:
+        TypeError: If any code is not a string.
+        UnicodeEncodeError: If any code is not ASCII.
+    """
+    if len(type_code) == len(subtype_code) == len(manufacturer_code) == 4:
+        raw = f"{type_code}{subtype_code}{manufacturer_code}".encode("ascii")
+        return raw.hex("-", 4)
+    return (
+        f"{type_code.encode('ascii').hex()}-"
+        f"{subtype_code.encode('ascii').hex()}-"
+        f"{manufacturer_code.encode('ascii').hex()}"
+    )
+
+
+@dataclass(init=False, eq=False, slots=True)
 class AudioComponent:
     """Represents a single Audio Unit component.
 
@@ -115,7 +174,8 @@ class AudioComponent:
         version: Plugin version number.
         tags_id: Unique identifier for tagset lookup.
         tagset: Associated Tagset containing tags and metadata.
-        categories: List of Category objects this plugin belongs to.
+        categories: List of Category objects this plugin belongs to. Built on
+            first access from the tag names read by load().
     """
 
     full_name: str
@@ -130,7 +190,12 @@ class AudioComponent:
     version: int
     tags_id: str
     tagset: Tagset
-    categories: list[Category] = field(default_factory=list)
+    tags_path: Path = field(repr=False, compare=False)
+    lazy: bool = field(repr=False, compare=False)
+    musicapps: MusicApps = field(repr=False, compare=False)
+    _category_names: list[str] = field(repr=False, compare=False)
+    _categories: list[Category] | None = field(repr=False, compare=False)
+    _hash: int = field(repr=False, compare=False)
 
     def __init__(
         self,
@@ -146,7 +211,8 @@ class AudioComponent:
             data: Dictionary containing component metadata from Info.plist.
             lazy: If True, defer loading tagset and categories until needed.
             tags_path: Path to tags database directory.
-            musicapps: Shared MusicApps instance for category management.
+            musicapps: Shared MusicApps instance for category management
+                (MusicApps.get(tags_path) if None).
 
         Raises:
             CannotParseComponentError: If required fields are missing or malformed.
@@ -155,12 +221,14 @@ class AudioComponent:
         """
         self.tags_path = tags_path
         self.lazy = lazy
-        self.musicapps = musicapps or MusicApps(tags_path=self.tags_path, lazy=lazy)
+        self.musicapps = musicapps or MusicApps.get(self.tags_path, lazy=lazy)
+        self._category_names = []
+        self._categories = None
 
         try:
             self.full_name = data.get("name")
-            self.manufacturer = self.full_name.split(": ")[0]
-            self.name = self.full_name.split(": ")[-1]
+            self.manufacturer = self.full_name.partition(": ")[0]
+            self.name = self.full_name.rpartition(": ")[2]
             self.manufacturer_code = data.get("manufacturer")
             self.description = data.get("description")
             self.factory_function = data.get("factoryFunction")
@@ -168,11 +236,10 @@ class AudioComponent:
             self.type_name = AudioUnitType.from_code(self.type_code)
             self.subtype_code = data.get("subtype")
             self.version = int(data.get("version"))
-            self.tags_id = (
-                f"{self.type_code.encode('ascii').hex()}-"
-                f"{self.subtype_code.encode('ascii').hex()}-"
-                f"{self.manufacturer_code.encode('ascii').hex()}"
+            self.tags_id = _tags_id(
+                self.type_code, self.subtype_code, self.manufacturer_code
             )
+            self._hash = hash(self.tags_id)
             logger.debug(f"Created AudioComponent {self.full_name} from data")
         except Exception as e:
             raise CannotParseComponentError(
@@ -183,10 +250,12 @@ class AudioComponent:
             self.load()
 
     def load(self) -> "AudioComponent":
-        """Load tagset and categories for this component.
+        """Load tagset and category names for this component.
 
-        Loads the component's tagset from disk and initializes Category objects
-        for all tags. Invalid categories are logged as warnings and skipped.
+        Loads the component's tagset from disk and records the names of its
+        tags. An already bound Tagset is reused, so its file is only re-parsed
+        if it changed. Category objects are only created when categories is
+        accessed.
 
         Returns:
             AudioComponent: Self for method chaining.
@@ -194,24 +263,50 @@ class AudioComponent:
         Raises:
             NonexistentTagsetError: If tagset file doesn't exist (from Tagset).
             CannotParseTagsetError: If tagset file cannot be parsed (from Tagset).
-            MusicAppsLoadError: If MusicApps database files cannot be loaded (from Category).
         """
         logger.debug(f"Loading AudioComponent {self.full_name}")
-        self.tagset = Tagset(self.tags_path / self.tags_id, lazy=self.lazy)
+        path = self.tags_path / f"{self.tags_id}.tagset"
+        tagset = getattr(self, "tagset", None)
+        if tagset is not None and tagset.path == path:
+            # Reloads only if the file changed since the last load or write.
+            tagset.load()
+        else:
+            self.tagset = Tagset(path, lazy=self.lazy)
         logger.debug(f"Loaded Tagset for {self.full_name}")
-        self.categories = []
-        for name in self.tagset.tags.keys():
+        self._category_names = list(self.tagset.tags.keys())
+        self._categories = None
+        return self
+
+    @property
+    def categories(self) -> list[Category]:
+        """Get Category objects for all tags of this component.
+
+        Categories are created on first access and reused until the next load().
+        Invalid categories are logged as warnings and skipped.
+
+        Returns:
+            list[Category]: Categories this plugin belongs to.
+
+        Raises:
+            MusicAppsLoadError: If MusicApps database files cannot be loaded (from Category).
+        """
+        if self._categories is not None:
+            return self._categories
+
+        categories = []
+        for name in self._category_names:
             try:
                 logger.debug(f"Loading category {name} for {self.full_name}")
-                self.categories.append(
+                categories.append(
                     Category(name, musicapps=self.musicapps, lazy=self.lazy)
                 )
             except Exception as e:
                 logger.warning(
                     f"Failed to load category {name} for {self.full_name}: {e}"
                 )
-        logger.debug(f"Loaded {len(self.categories)} categories for {self.full_name}")
-        return self
+        logger.debug(f"Loaded {len(categories)} categories for {self.full_name}")
+        self._categories = categories
+        return categories
 
     def __eq__(self, other) -> bool:
         """Check equality based on tags_id.
@@ -232,7 +327,7 @@ class AudioComponent:
         Returns:
             int: Hash value.
         """
-        return hash(self.tags_id)
+        return self._hash
 
     def set_nickname(self, nickname: str | None) -> "AudioComponent":
         """Set or remove a custom nickname for this component.
@@ -358,9 +453,10 @@ class AudioComponent:
             TagsetWriteError: If writing tagset fails (from Tagset operations).
             KeyError: If a category tag doesn't exist during removal (from Tagset.remove_tag).
         """
-        for category in self.categories:
-            self.tagset.add_tag(category.parent.name, "user")
-            self.tagset.remove_tag(category.name)
+        with self.tagset.batch():
+            for category in self.categories:
+                self.tagset.add_tag(category.parent.name, "user")
+                self.tagset.remove_tag(category.name)
         self.load()
         return self
 
@@ -5,11 +5,12 @@ Audio Component bundles (.component directories) and their Info.plist files.
 """
 
 import logging
-import plistlib
-from dataclasses import dataclass
+from collections.abc import Iterator
+from contextlib import closing
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from .. import defaults
+from .. import _plist, defaults
 from ..exceptions import (
     CannotParseComponentError,
     CannotParsePlistError,
@@ -22,7 +23,38 @@ from .audiocomponent import AudioComponent
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _stream_audio_components(path: Path, metadata: dict) -> Iterator[dict]:
+    """Yield the AudioComponents entries of an Info.plist one at a time.
+
+    Each entry is yielded as soon as it is parsed, and its XML is discarded
+    right after (see _plist.iterload). The other top-level entries are
+    written into metadata, which is only complete once the generator is
+    exhausted.
+
+    Args:
+        path: Path to Info.plist.
+        metadata: Dictionary that receives the other top-level entries.
+
+    Yields:
+        dict: Raw AudioComponents entries.
+
+    Raises:
+        NonexistentPlistError: If Info.plist file doesn't exist.
+        CannotParsePlistError: If plist cannot be parsed. This wraps:
+            - plistlib.InvalidFileException: Invalid plist format.
+            - OSError, IOError: File read errors.
+            - UnicodeDecodeError: Encoding issues.
+    """
+    logger.debug(f"Parsing Info.plist at {path}")
+    try:
+        yield from _plist.iterload(path, "AudioComponents", metadata)
+    except FileNotFoundError as e:
+        raise NonexistentPlistError(f"Info.plist not found at {path}") from e
+    except Exception as e:
+        raise CannotParsePlistError(f"An error occurred: {e}") from e
+
+
+@dataclass(init=False, eq=False, slots=True)
 class Component:
     """Represents a macOS Audio Component bundle.
 
@@ -43,6 +75,10 @@ class Component:
     short_version: str
     version: str
     audio_components: list[AudioComponent]
+    path: Path = field(repr=False, compare=False)
+    lazy: bool = field(repr=False, compare=False)
+    tags_path: Path = field(repr=False, compare=False)
+    musicapps: MusicApps = field(repr=False, compare=False)
 
     def __init__(
         self,
@@ -58,7 +94,9 @@ class Component:
             path: Path to .component bundle (with or without .component extension).
             lazy: If True, defer loading Info.plist and AudioComponents.
             tags_path: Path to tags database directory.
-            musicapps: Shared MusicApps instance for category management.
+            musicapps: Shared MusicApps instance for category management
+                (MusicApps.get(tags_path) if None). It is passed on to every
+                AudioComponent of the bundle.
 
         Note:
             If lazy=False, raises can occur from load() method during initialization.
@@ -66,59 +104,66 @@ class Component:
         self.path = path if path.suffix == ".component" else Path(f"{path}.component")
         self.lazy = lazy
         self.tags_path = tags_path
-        self.musicapps = musicapps or MusicApps(tags_path=self.tags_path, lazy=lazy)
+        self.musicapps = musicapps or MusicApps.get(self.tags_path, lazy=lazy)
         logger.debug(f"Created Component from {self.path}")
 
         if not lazy:
             self.load()
 
-    def _parse_plist(self):
-        """Parse the Info.plist file from the component bundle.
-
-        Returns:
-            dict: Parsed plist data.
-
-        Raises:
-            NonexistentPlistError: If Info.plist file doesn't exist.
-            CannotParsePlistError: If plist cannot be parsed. This wraps:
-                - plistlib.InvalidFileException: Invalid plist format.
-                - OSError, IOError: File read errors.
-                - UnicodeDecodeError: Encoding issues.
-        """
-        info_plist_path = self.path / "Contents" / "Info.plist"
-        logger.debug(f"Parsing Info.plist at {info_plist_path}")
-        if not info_plist_path.exists():
-            raise NonexistentPlistError(f"Info.plist not found at {info_plist_path}")
-
-        try:
-            with open(info_plist_path, "rb") as fp:
-                plist_data = plistlib.load(fp)
-                return plist_data
-        except Exception as e:
-            raise CannotParsePlistError(f"An error occurred: {e}") from e
-
     def load(self) -> "Component":
         """Load and parse the component bundle and its AudioComponents.
 
-        Parses Info.plist, extracts bundle metadata, and creates AudioComponent
-        instances for each Audio Unit defined in the AudioComponents array.
+        Streams the AudioComponents array of Info.plist, creating an
+        AudioComponent instance for each Audio Unit as its entry is parsed,
+        then extracts the bundle metadata. All AudioComponents share this
+        component's MusicApps instance.
 
         Returns:
             Component: Self for method chaining.
 
         Raises:
-            NonexistentPlistError: If Info.plist doesn't exist (from _parse_plist).
+            NonexistentPlistError: If Info.plist doesn't exist
+                (from _stream_audio_components).
             CannotParsePlistError: If plist parsing or metadata extraction fails.
                 This wraps AttributeError, TypeError from dict.get() operations.
             OldComponentFormatError: If AudioComponents key is missing (legacy format).
             CannotParseComponentError: If AudioComponent instantiation fails.
                 This wraps CannotParseComponentError from AudioComponent.__init__.
         """
-        plist_data = self._parse_plist()
+        self.name = self.path.name.removesuffix(".component")
+        plist_data = {}
+        entries = _stream_audio_components(
+            self.path / "Contents" / "Info.plist", plist_data
+        )
+
+        # Close the stream, and with it Info.plist, if an entry fails to parse.
+        with closing(entries):
+            try:
+                logger.debug(f"Loading components for {self.name}")
+                audio_components = [
+                    AudioComponent(
+                        data,
+                        lazy=self.lazy,
+                        tags_path=self.tags_path,
+                        musicapps=self.musicapps,
+                    )
+                    for data in entries
+                ]
+            except (NonexistentPlistError, CannotParsePlistError):
+                raise
+            except Exception as e:
+                raise CannotParseComponentError(
+                    "An error occurred while loading components"
+                ) from e
         logger.debug(f"Loaded Info.plist for {self.path}")
 
+        if "AudioComponents" not in plist_data:
+            raise OldComponentFormatError(
+                "This component is in an old format and cannot be loaded"
+            )
+        self.audio_components = audio_components
+
         try:
-            self.name = self.path.name.removesuffix(".component")
             self.bundle_id = plist_data.get("CFBundleIdentifier")
             self.version = plist_data.get("CFBundleVersion")
             self.short_version = plist_data.get("CFBundleShortVersionString")
@@ -127,28 +172,9 @@ class Component:
             raise CannotParsePlistError(
                 f"An error occurred while extracting: {e}"
             ) from e
-        try:
-            logger.debug(f"Loading components for {self.bundle_id}")
-            self.audio_components = [
-                AudioComponent(
-                    name,
-                    lazy=self.lazy,
-                    tags_path=self.tags_path,
-                    musicapps=self.musicapps,
-                )
-                for name in plist_data["AudioComponents"]
-            ]
-            logger.debug(
-                f"Loaded {len(self.audio_components)} components for {self.bundle_id}"
-            )
-        except KeyError as e:
-            raise OldComponentFormatError(
-                "This component is in an old format and cannot be loaded"
-            ) from e
-        except Exception as e:
-            raise CannotParseComponentError(
-                "An error occurred while loading components"
-            ) from e
+        logger.debug(
+            f"Loaded {len(self.audio_components)} components for {self.bundle_id}"
+        )
 
         logger.debug(f"Loaded {self.name} from {self.path}")
         return self
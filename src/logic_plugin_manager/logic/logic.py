@@ -91,7 +91,10 @@ class Logic:
             try:
                 logger.debug(f"Loading component {component_path}")
                 component = Component(
-                    component_path, lazy=self.lazy, musicapps=self.musicapps
+                    component_path,
+                    lazy=self.lazy,
+                    tags_path=self.tags_path,
+                    musicapps=self.musicapps,
                 )
                 self.components.add(component)
                 logger.debug(f"Loading plugins for {component.name}")
@@ -0,0 +1,133 @@
+"""Shared edit and batch handling for plist-backed tag files.
+
+This module provides the PlistFile base class used by Tagset, Tagpool and
+Properties. It tracks the file's change stamp, reloads before edits and
+coalesces writes inside batch() blocks. Subclasses implement load() and the
+_write() hook.
+
+The private _version counter changes whenever the in-memory data does,
+after a re-parse in load() or any edit. Objects that derive values from
+the data can compare it to tell whether their copies are stale.
+"""
+
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .. import _plist
+
+
+def intern(value):
+    """Intern a string read from or written to a tag file.
+
+    Args:
+        value: Any plist value.
+
+    Returns:
+        The interned string, or value unchanged if it is not a str.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(init=False, slots=True)
+class PlistFile:
+    """Base class for tag files that are edited in place.
+
+    Subclasses must define two methods:
+
+    - load(): Parse the file unless _is_current() reports the stamp
+      unchanged, then call _loaded() with that stamp. Must return self.
+    - _write(): Serialize the in-memory data to path. Called by the edit and
+      batch handling below, never directly.
+
+    Attributes:
+        path: Path to the plist file.
+        lazy: If True, loading was deferred until needed.
+    """
+
+    path: Path = field(repr=False, compare=False)
+    lazy: bool = field(repr=False, compare=False)
+    _in_batch: bool = field(repr=False, compare=False)
+    _dirty: bool = field(repr=False, compare=False)
+    _stamp: tuple[int, int] | None = field(repr=False, compare=False)
+    _version: int = field(repr=False, compare=False)
+
+    def _init_file(self, path: Path, lazy: bool):
+        self.path = path
+        self.lazy = lazy
+        self._in_batch = False
+        self._dirty = False
+        self._stamp = None
+        self._version = 0
+
+    def _is_current(self, stamp: tuple[int, int] | None) -> bool:
+        """Check whether the in-memory data matches the file's stamp.
+
+        Args:
+            stamp: Stamp from _plist.stamp(), taken before parsing.
+
+        Returns:
+            bool: True if the file is unchanged since the last load or write
+                by this instance.
+        """
+        return stamp is not None and stamp == self._stamp
+
+    def _loaded(self, stamp: tuple[int, int] | None):
+        self._stamp = stamp
+        self._version += 1
+
+    def _refresh(self):
+        if not self._in_batch:
+            self.load()
+
+    def _before_edit(self):
+        self._refresh()
+
+    def _after_edit(self):
+        self._version += 1
+        if self._in_batch:
+            self._dirty = True
+            return
+        self._flush()
+
+    def _flush(self):
+        self._stamp = None
+        self._write()
+        self._stamp = _plist.stamp(self.path)
+
+    @contextmanager
+    def batch(self):
+        """Group several edits into a single write of the file.
+
+        Inside the block, mutators only update the in-memory data. The file is
+        written once when the block exits. If the block raises, nothing is
+        written and the in-memory edits are discarded. Nested batch() blocks
+        join the outermost one.
+
+        Yields:
+            Self.
+
+        Raises:
+            Errors raised by load() and by the subclass's write.
+        """
+        if self._in_batch:
+            yield self
+            return
+
+        self.load()
+        self._in_batch = True
+        self._dirty = False
+        try:
+            yield self
+        except BaseException:
+            self._in_batch = False
+            self._stamp = None
+            self.load()
+            raise
+        self._in_batch = False
+        if self._dirty:
+            self._flush()
+
+
+__all__ = ["PlistFile", "intern"]
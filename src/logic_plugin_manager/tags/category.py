@@ -8,12 +8,13 @@ import logging
 from dataclasses import dataclass, field
 
 from ..exceptions import CategoryExistsError, CategoryValidationError
+from ._plistfile import intern
 from .musicapps import MusicApps
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(init=False, slots=True)
 class Category:
     """Represents a Logic Pro plugin category.
 
@@ -26,6 +27,11 @@ class Category:
         is_root: True if this is the root category (empty name).
         plugin_amount: Number of plugins in this category.
         lazy: Whether lazy loading is enabled.
+
+    Note:
+        parent is computed once and cached until the next load(). index,
+        neighbors, is_first and is_last are cached until the shared
+        properties change, so moving any category refreshes them.
     """
 
     name: str
@@ -33,23 +39,29 @@ class Category:
     is_root: bool
     plugin_amount: int
     lazy: bool
+    _memo: dict[str, object] = field(repr=False, compare=False)
+    _positions: dict[str, object] = field(repr=False, compare=False)
+    _positions_version: tuple[object, int] | None = field(repr=False, compare=False)
 
     def __init__(self, name: str, *, musicapps: MusicApps = None, lazy: bool = False):
         """Initialize a Category.
 
         Args:
             name: Category name.
-            musicapps: MusicApps instance (created if None).
+            musicapps: MusicApps instance (shared default if None).
             lazy: If True, defer validation.
 
         Note:
             If lazy=False, raises can occur from load() during initialization.
         """
-        self.name = name
-        self.musicapps = musicapps or MusicApps(lazy=lazy)
+        self.name = intern(name)
+        self.musicapps = musicapps or MusicApps.get(lazy=lazy)
         self.is_root = False
         self.plugin_amount = 0
         self.lazy = lazy
+        self._memo = {}
+        self._positions = {}
+        self._positions_version = None
 
         if not lazy:
             self.load()
@@ -61,6 +73,8 @@ class Category:
             CategoryValidationError: If category doesn't exist in database.
             MusicAppsLoadError: If database files cannot be loaded.
         """
+        self._memo.clear()
+        self._positions.clear()
         logger.debug(f"Validating category {self.name}")
         if self.name not in self.musicapps.tagpool.categories.keys():
             raise CategoryValidationError(f"Category {self.name} not found in tagpool")
@@ -80,7 +94,7 @@ class Category:
 
         Args:
             name: Name for the new category.
-            musicapps: MusicApps instance (created if None).
+            musicapps: MusicApps instance (shared default if None).
             lazy: Whether to use lazy loading.
 
         Returns:
@@ -93,7 +107,7 @@ class Category:
         """
         logger.debug(f"Introducing category {name}")
         if musicapps is None:
-            musicapps = MusicApps()
+            musicapps = MusicApps.get()
         try:
             cls(name, musicapps=musicapps, lazy=lazy)
             raise CategoryExistsError(f"Category {name} already exists")
@@ -106,6 +120,29 @@ class Category:
 
         return cls(name, musicapps=musicapps)
 
+    def _memoized(self, key: str, compute):
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
+
+    def _positional(self, key: str, compute):
+        properties = self.musicapps.properties
+        version = self._positions_version
+        if (
+            version is None
+            or version[0] is not properties
+            or version[1] != properties._version
+        ):
+            self._positions.clear()
+            self._positions_version = (properties, properties._version)
+        try:
+            return self._positions[key]
+        except KeyError:
+            value = self._positions[key] = compute()
+            return value
+
     @property
     def parent(self) -> "Category":
         """Get the parent category in the hierarchy.
@@ -115,10 +152,13 @@ class Category:
         """
         if self.is_root:
             return self
-        return self.__class__(
-            ":".join(self.name.split(":")[:-1]),
-            musicapps=self.musicapps,
-            lazy=self.lazy,
+        return self._memoized(
+            "parent",
+            lambda: self.__class__(
+                self.name.rpartition(":")[0],
+                musicapps=self.musicapps,
+                lazy=self.lazy,
+            ),
         )
 
     def child(self, name: str) -> "Category":
@@ -196,12 +236,17 @@ class Category:
 
     @property
     def index(self):
-        return self.musicapps.properties.get_index(self.name)
+        return self._positional(
+            "index", lambda: self.musicapps.properties.get_index(self.name)
+        )
 
     @property
     def neighbors(self):
         if self.is_root:
             return None, None
+        return self._positional("neighbors", self._load_neighbors)
+
+    def _load_neighbors(self):
         neighbors = self.musicapps.properties.get_neighbors(self.name)
         if neighbors is None or len(neighbors) != 2:
             return None, None
@@ -212,11 +257,15 @@ class Category:
 
     @property
     def is_first(self):
-        return self.musicapps.properties.is_first(self.name)
+        return self._positional(
+            "is_first", lambda: self.musicapps.properties.is_first(self.name)
+        )
 
     @property
     def is_last(self):
-        return self.musicapps.properties.is_last(self.name)
+        return self._positional(
+            "is_last", lambda: self.musicapps.properties.is_last(self.name)
+        )
 
 
 __all__ = ["Category"]
@@ -5,22 +5,38 @@ files (MusicApps.tagpool and MusicApps.properties) which store category definiti
 plugin counts, and sorting information.
 """
 
+import functools
 import logging
-import plistlib
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from .. import defaults
+from .. import _plist, defaults
 from ..exceptions import MusicAppsLoadError, MusicAppsWriteError
+from ._plistfile import PlistFile, intern
 
 logger = logging.getLogger(__name__)
 
-
-def _parse_plist(path: Path):
+_REORDER_OPERATIONS = frozenset(
+    {
+        "move_up",
+        "move_down",
+        "move_to_top",
+        "move_to_bottom",
+        "move_before",
+        "move_after",
+        "move_to_index",
+        "swap",
+    }
+)
+
+
+def _parse_plist(path: Path, stamp: tuple[int, int] | None = None):
     """Parse a plist file from the MusicApps database.
 
     Args:
         path: Path to plist file.
+        stamp: The file's _plist.stamp(), if already taken by the caller.
 
     Returns:
         dict: Parsed plist data.
@@ -30,13 +46,12 @@ def _parse_plist(path: Path):
             This wraps plistlib.InvalidFileException, OSError, IOError, UnicodeDecodeError.
     """
     logger.debug(f"Parsing plist at {path}")
-    if not path.exists():
-        raise MusicAppsLoadError(f"File not found at {path}")
     try:
-        with open(path, "rb") as fp:
-            plist_data = plistlib.load(fp)
-            logger.debug(f"Parsed plist for {path}")
-            return plist_data
+        plist_data = _plist.load(path, stamp)
+        logger.debug(f"Parsed plist for {path}")
+        return plist_data
+    except FileNotFoundError as e:
+        raise MusicAppsLoadError(f"File not found at {path}") from e
     except Exception as e:
         raise MusicAppsLoadError(f"An error occurred: {e}") from e
 
@@ -44,6 +59,9 @@ def _parse_plist(path: Path):
 def _save_plist(path: Path, data: dict):
     """Save data to a plist file in the MusicApps database.
 
+    Files are written as binary plists, which are smaller and cheaper to parse
+    on the next load than XML. Logic Pro reads either format.
+
     Args:
         path: Path to plist file.
         data: Dictionary to serialize and write.
@@ -52,17 +70,18 @@ def _save_plist(path: Path, data: dict):
         MusicAppsWriteError: If writing fails.
             This wraps OSError, IOError, TypeError.
     """
+    import plistlib
+
     logger.debug(f"Saving plist to {path}")
     try:
-        with open(path, "wb") as fp:
-            plistlib.dump(data, fp)
-            logger.debug(f"Saved plist to {path}")
+        _plist.dump(path, data, fmt=plistlib.FMT_BINARY)
+        logger.debug(f"Saved plist to {path}")
     except Exception as e:
         raise MusicAppsWriteError(f"An error occurred: {e}") from e
 
 
-@dataclass
-class Tagpool:
+@dataclass(init=False, slots=True)
+class Tagpool(PlistFile):
     """Represents MusicApps.tagpool - category to plugin count mapping.
 
     The tagpool file stores a dictionary mapping category names to the number
@@ -81,8 +100,7 @@ class Tagpool:
             tags_path: Path to tags database directory.
             lazy: If True, defer loading the file.
         """
-        self.path = tags_path / "MusicApps.tagpool"
-        self.lazy = lazy
+        self._init_file(tags_path / "MusicApps.tagpool", lazy)
 
         logger.debug(f"Created Tagpool from {self.path}")
 
@@ -92,17 +110,28 @@ class Tagpool:
     def load(self) -> "Tagpool":
         """Load tagpool data from disk.
 
+        Does nothing if the file's modification time and size are unchanged
+        since the last load or write by this instance.
+
         Returns:
             Tagpool: Self for method chaining.
 
         Raises:
             MusicAppsLoadError: If file cannot be loaded (from _parse_plist).
         """
+        stamp = _plist.stamp(self.path)
+        if self._is_current(stamp):
+            return self
+
         logger.debug(f"Loading Tagpool data from {self.path}")
-        self.categories = _parse_plist(self.path)
+        self.categories = _parse_plist(self.path, stamp)
+        self._loaded(stamp)
         logger.debug(f"Loaded Tagpool data from {self.path}")
         return self
 
+    def _write(self):
+        _save_plist(self.path, self.categories)
+
     def write_category(self, name: str, plugin_count: int = 0):
         """Write or update a category with its plugin count.
 
@@ -114,10 +143,9 @@ class Tagpool:
             MusicAppsLoadError: If file cannot be loaded (from load).
             MusicAppsWriteError: If file cannot be written (from _save_plist).
         """
-        self.load()
+        self._before_edit()
         self.categories[name] = plugin_count
-        _save_plist(self.path, self.categories)
-        self.load()
+        self._after_edit()
 
     def introduce_category(self, name: str):
         """Add a new category if it doesn't exist.
@@ -129,7 +157,7 @@ class Tagpool:
             MusicAppsLoadError: If file cannot be loaded (from load).
             MusicAppsWriteError: If file cannot be written (from write_category).
         """
-        self.load()
+        self._before_edit()
         if name in self.categories:
             return
         self.write_category(name)
@@ -144,14 +172,13 @@ class Tagpool:
             MusicAppsLoadError: If file cannot be loaded (from load).
             MusicAppsWriteError: If file cannot be written (from _save_plist).
         """
-        self.load()
+        self._before_edit()
         self.categories.pop(name, None)
-        _save_plist(self.path, self.categories)
-        self.load()
+        self._after_edit()
 
 
-@dataclass
-class Properties:
+@dataclass(init=False, slots=True)
+class Properties(PlistFile):
     """Represents MusicApps.properties - category sorting and preferences.
 
     The properties file stores the category sorting order and whether user
@@ -165,6 +192,7 @@ class Properties:
     sorting: list[str]
     user_sorted: bool
     __raw_data: dict[str, str | list[str] | bool] = field(repr=False)
+    _pos: dict[str, int] = field(repr=False, compare=False)
 
     def __init__(self, tags_path: Path, *, lazy: bool = False):
         """Initialize Properties from database path.
@@ -173,8 +201,7 @@ class Properties:
             tags_path: Path to tags database directory.
             lazy: If True, defer loading the file.
         """
-        self.path = tags_path / "MusicApps.properties"
-        self.lazy = lazy
+        self._init_file(tags_path / "MusicApps.properties", lazy)
 
         logger.debug(f"Created Properties from {self.path}")
 
@@ -184,46 +211,137 @@ class Properties:
     def load(self) -> "Properties":
         """Load properties data from disk.
 
+        Does nothing if the file's modification time and size are unchanged
+        since the last load or write by this instance.
+
         Returns:
             Properties: Self for method chaining.
 
         Raises:
             MusicAppsLoadError: If file cannot be loaded (from _parse_plist).
         """
+        stamp = _plist.stamp(self.path)
+        if self._is_current(stamp):
+            return self
+
         logger.debug(f"Loading Properties data from {self.path}")
-        self.__raw_data = _parse_plist(self.path)
+        self.__raw_data = _parse_plist(self.path, stamp)
+        self._loaded(stamp)
         logger.debug(f"Loaded Properties data from {self.path}")
 
-        self.sorting = self.__raw_data.get("sorting", [])
+        self.sorting = [intern(name) for name in self.__raw_data.get("sorting", [])]
+        if "sorting" in self.__raw_data:
+            self.__raw_data["sorting"] = self.sorting
+        self._pos = {name: idx for idx, name in enumerate(self.sorting)}
         self.user_sorted = bool(self.__raw_data.get("user_sorted", False))
         logger.debug(f"Parsed Properties data from {self.path}")
         return self
 
+    def _write(self):
+        _save_plist(self.path, self.__raw_data)
+
     def introduce_category(self, name: str):
-        self.load()
-        if name in self.sorting:
+        self._before_edit()
+        if name in self._pos:
             return
-        self.__raw_data["sorting"].append(name)
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        name = intern(name)
+        self._pos[name] = len(self.sorting)
+        self.sorting.append(name)
+        self._save_sorting()
 
     def enable_user_sorting(self):
-        self.load()
+        self._before_edit()
         self.__raw_data["user_sorted"] = "property"
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self.user_sorted = True
+        self._after_edit()
 
     def enable_alphabetical_sorting(self):
-        self.load()
+        self._before_edit()
         del self.__raw_data["user_sorted"]
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self.user_sorted = False
+        self._after_edit()
 
     def remove_category(self, name: str):
-        self.load()
-        self.__raw_data["sorting"].remove(name)
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self._before_edit()
+        idx = self._position(name, f"Category '{name}' not found in sorting")
+        del self.sorting[idx]
+        del self._pos[name]
+        self._reindex(idx)
+        self._save_sorting()
+
+    def _position(self, category: str, message: str) -> int:
+        try:
+            return self._pos[category]
+        except KeyError:
+            raise ValueError(message) from None
+
+    def _reindex(self, start: int = 0, stop: int | None = None):
+        sorting = self.sorting
+        for idx in range(start, len(sorting) if stop is None else stop):
+            self._pos[sorting[idx]] = idx
+
+    def _move(self, category: str, new_idx: int):
+        current_idx = self._pos[category]
+        if current_idx == new_idx:
+            return
+        self.sorting.insert(new_idx, self.sorting.pop(current_idx))
+        self._reindex(min(current_idx, new_idx), max(current_idx, new_idx) + 1)
+
+    def _save_sorting(self):
+        self.__raw_data["sorting"] = self.sorting
+        self._after_edit()
+
+    def _move_up(self, category: str, steps: int = 1):
+        current_idx = self._position(
+            category, f"Category '{category}' not found in sorting"
+        )
+        self._move(category, max(0, current_idx - steps))
+
+    def _move_down(self, category: str, steps: int = 1):
+        current_idx = self._position(
+            category, f"Category '{category}' not found in sorting"
+        )
+        self._move(category, min(len(self.sorting) - 1, current_idx + steps))
+
+    def _move_to_top(self, category: str):
+        self._position(category, f"Category '{category}' not found in sorting")
+        self._move(category, 0)
+
+    def _move_to_bottom(self, category: str):
+        self._position(category, f"Category '{category}' not found in sorting")
+        self._move(category, len(self.sorting) - 1)
+
+    def _move_before(self, category: str, target: str):
+        current_idx = self._position(category, f"Category '{category}' not found")
+        target_idx = self._position(target, f"Target category '{target}' not found")
+        if current_idx < target_idx:
+            target_idx -= 1
+        self._move(category, target_idx)
+
+    def _move_after(self, category: str, target: str):
+        current_idx = self._position(category, f"Category '{category}' not found")
+        target_idx = self._position(target, f"Target category '{target}' not found")
+        if current_idx > target_idx:
+            target_idx += 1
+        self._move(category, target_idx)
+
+    def _move_to_index(self, category: str, index: int):
+        self._position(category, f"Category '{category}' not found")
+
+        if index < 0:
+            index = len(self.sorting) + index
+
+        self._move(category, max(0, min(len(self.sorting) - 1, index)))
+
+    def _swap(self, category1: str, category2: str):
+        if category1 not in self._pos or category2 not in self._pos:
+            raise ValueError("Both categories must exist")
+
+        idx1 = self._pos[category1]
+        idx2 = self._pos[category2]
+
+        self.sorting[idx1], self.sorting[idx2] = category2, category1
+        self._pos[category1], self._pos[category2] = idx2, idx1
 
     def move_up(self, category: str, steps: int = 1):
         """Move a category up in the sorting order.
@@ -237,138 +355,70 @@ class Properties:
             MusicAppsLoadError: If file cannot be loaded (from load).
             MusicAppsWriteError: If file cannot be written (from _save_plist).
         """
-        self.load()
-        sorting = self.sorting.copy()
-
-        if category not in sorting:
-            raise ValueError(f"Category '{category}' not found in sorting")
-
-        current_idx = sorting.index(category)
-        new_idx = max(0, current_idx - steps)
-
-        sorting.pop(current_idx)
-        sorting.insert(new_idx, category)
-
-        self.__raw_data["sorting"] = sorting
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self._before_edit()
+        self._move_up(category, steps)
+        self._save_sorting()
 
     def move_down(self, category: str, steps: int = 1):
-        self.load()
-        sorting = self.sorting.copy()
-
-        if category not in sorting:
-            raise ValueError(f"Category '{category}' not found in sorting")
-
-        current_idx = sorting.index(category)
-        new_idx = min(len(sorting) - 1, current_idx + steps)
-
-        sorting.pop(current_idx)
-        sorting.insert(new_idx, category)
-
-        self.__raw_data["sorting"] = sorting
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self._before_edit()
+        self._move_down(category, steps)
+        self._save_sorting()
 
     def move_to_top(self, category: str):
-        self.load()
-        sorting = self.sorting.copy()
-
-        if category not in sorting:
-            raise ValueError(f"Category '{category}' not found in sorting")
-
-        sorting.remove(category)
-        sorting.insert(0, category)
-
-        self.__raw_data["sorting"] = sorting
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self._before_edit()
+        self._move_to_top(category)
+        self._save_sorting()
 
     def move_to_bottom(self, category: str):
-        self.load()
-        sorting = self.sorting.copy()
-
-        if category not in sorting:
-            raise ValueError(f"Category '{category}' not found in sorting")
-
-        sorting.remove(category)
-        sorting.append(category)
-
-        self.__raw_data["sorting"] = sorting
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self._before_edit()
+        self._move_to_bottom(category)
+        self._save_sorting()
 
     def move_before(self, category: str, target: str):
-        self.load()
-        sorting = self.sorting.copy()
-
-        if category not in sorting:
-            raise ValueError(f"Category '{category}' not found")
-        if target not in sorting:
-            raise ValueError(f"Target category '{target}' not found")
-
-        sorting.remove(category)
-        target_idx = sorting.index(target)
-        sorting.insert(target_idx, category)
-
-        self.__raw_data["sorting"] = sorting
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self._before_edit()
+        self._move_before(category, target)
+        self._save_sorting()
 
     def move_after(self, category: str, target: str):
-        self.load()
-        sorting = self.sorting.copy()
-
-        if category not in sorting:
-            raise ValueError(f"Category '{category}' not found")
-        if target not in sorting:
-            raise ValueError(f"Target category '{target}' not found")
-
-        sorting.remove(category)
-        target_idx = sorting.index(target)
-        sorting.insert(target_idx + 1, category)
-
-        self.__raw_data["sorting"] = sorting
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self._before_edit()
+        self._move_after(category, target)
+        self._save_sorting()
 
     def move_to_index(self, category: str, index: int):
-        self.load()
-        sorting = self.sorting.copy()
-
-        if category not in sorting:
-            raise ValueError(f"Category '{category}' not found")
-
-        if index < 0:
-            index = len(sorting) + index
-
-        index = max(0, min(len(sorting) - 1, index))
-
-        sorting.remove(category)
-        sorting.insert(index, category)
-
-        self.__raw_data["sorting"] = sorting
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self._before_edit()
+        self._move_to_index(category, index)
+        self._save_sorting()
 
     def swap(self, category1: str, category2: str):
-        self.load()
-        sorting = self.sorting.copy()
+        self._before_edit()
+        self._swap(category1, category2)
+        self._save_sorting()
 
-        if category1 not in sorting or category2 not in sorting:
-            raise ValueError("Both categories must exist")
+    def batch_reorder(self, operations: Iterable[tuple]):
+        """Apply several reordering operations and write the file once.
 
-        idx1 = sorting.index(category1)
-        idx2 = sorting.index(category2)
+        Each operation is a tuple of a method name followed by its arguments,
+        e.g. ``("move_up", "Effects", 2)`` or ``("swap", "Effects", "EQ")``.
+        Supported names are move_up, move_down, move_to_top, move_to_bottom,
+        move_before, move_after, move_to_index and swap.
 
-        sorting[idx1], sorting[idx2] = sorting[idx2], sorting[idx1]
+        Args:
+            operations: Operations to apply, in order.
 
-        self.__raw_data["sorting"] = sorting
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        Raises:
+            ValueError: If an operation is unknown or refers to a missing
+                category. Nothing is written in that case.
+            MusicAppsLoadError: If file cannot be loaded (from load).
+            MusicAppsWriteError: If file cannot be written (from _save_plist).
+        """
+        with self.batch():
+            for name, *args in operations:
+                if name not in _REORDER_OPERATIONS:
+                    raise ValueError(f"Unknown reorder operation '{name}'")
+                getattr(self, name)(*args)
 
     def set_order(self, categories: list[str]):
-        self.load()
+        self._before_edit()
         current = set(self.sorting)
         new = set(categories)
 
@@ -377,25 +427,23 @@ class Properties:
             extra = new - current
             raise ValueError(f"Category mismatch. Missing: {missing}, Extra: {extra}")
 
-        self.__raw_data["sorting"] = categories
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self.sorting = [intern(name) for name in categories]
+        self._pos = {name: idx for idx, name in enumerate(self.sorting)}
+        self._save_sorting()
 
     def reorder(self, key_func=None, reverse: bool = False):
-        self.load()
-        sorting = self.sorting.copy()
+        self._before_edit()
 
         if key_func is None:
-            sorting.sort(reverse=reverse)
+            self.sorting.sort(reverse=reverse)
         else:
-            sorting.sort(key=key_func, reverse=reverse)
+            self.sorting.sort(key=key_func, reverse=reverse)
 
-        self.__raw_data["sorting"] = sorting
-        _save_plist(self.path, self.__raw_data)
-        self.load()
+        self._reindex()
+        self._save_sorting()
 
     def get_index(self, category: str) -> int:
-        return self.sorting.index(category)
+        return self._position(category, f"Category '{category}' not found in sorting")
 
     def get_at_index(self, index: int) -> str:
         return self.sorting[index]
@@ -413,13 +461,18 @@ class Properties:
         return self.get_index(category) == len(self.sorting) - 1
 
 
-@dataclass
+@dataclass(init=False)
 class MusicApps:
     """Main interface to Logic Pro's MusicApps database.
 
     Provides unified access to both tagpool and properties files, managing
     category definitions, plugin counts, and sorting preferences.
 
+    The database is read-mostly, so a single instance is meant to be shared by
+    every component and category that uses the same tags path (see get()).
+    Reloading is cheap: plist files are only re-parsed when their modification
+    time or size changes.
+
     Attributes:
         tagpool: Tagpool instance managing category/plugin counts.
         properties: Properties instance managing sorting and preferences.
@@ -443,6 +496,34 @@ class MusicApps:
         if not lazy:
             self.load()
 
+    @classmethod
+    def get(
+        cls, tags_path: Path = defaults.tags_path, *, lazy: bool = False
+    ) -> "MusicApps":
+        """Get a shared MusicApps instance for a tags database path.
+
+        Instances are cached per (tags_path, lazy), so repeated calls return
+        the same object instead of loading the database again. When not lazy,
+        a cached instance reloads its tagpool and properties on each call.
+        This costs one stat() per file unless they changed on disk. Files in
+        the middle of a batch() are left alone.
+
+        Args:
+            tags_path: Path to tags database directory.
+            lazy: If True, defer loading files.
+
+        Returns:
+            MusicApps: Shared instance for the given path.
+
+        Raises:
+            MusicAppsLoadError: If files cannot be loaded (when lazy=False).
+        """
+        musicapps = _shared_musicapps(cls, Path(tags_path), lazy)
+        if not lazy:
+            musicapps.tagpool._refresh()
+            musicapps.properties._refresh()
+        return musicapps
+
     def load(self) -> "MusicApps":
         """Load both tagpool and properties files.
 
@@ -484,4 +565,9 @@ class MusicApps:
         self.properties.remove_category(name)
 
 
+@functools.lru_cache(maxsize=4)
+def _shared_musicapps(cls: type[MusicApps], tags_path: Path, lazy: bool) -> MusicApps:
+    return cls(tags_path, lazy=lazy)
+
+
 __all__ = ["MusicApps", "Properties", "Tagpool"]
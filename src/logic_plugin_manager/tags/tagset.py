@@ -4,19 +4,20 @@ This module provides the Tagset class for reading and writing .tagset files
 that store plugin metadata like nicknames, short names, and category tags.
 """
 
-import plistlib
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .. import _plist
 from ..exceptions import (
     CannotParseTagsetError,
     NonexistentTagsetError,
     TagsetWriteError,
 )
+from ._plistfile import PlistFile, intern
 
 
-@dataclass
-class Tagset:
+@dataclass(init=False, slots=True)
+class Tagset(PlistFile):
     """Represents a .tagset file containing plugin metadata and tags.
 
     Tagset files store custom metadata and category tags for Audio Components.
@@ -46,8 +47,7 @@ class Tagset:
         Note:
             If lazy=False, raises can occur from load() method during initialization.
         """
-        self.path = path.with_suffix(".tagset")
-        self.lazy = lazy
+        self._init_file(path.with_suffix(".tagset"), lazy)
 
         if not lazy:
             self.load()
@@ -65,16 +65,14 @@ class Tagset:
                 - OSError, IOError: File read errors.
                 - UnicodeDecodeError: Encoding issues.
         """
-        if not self.path.exists():
-            raise NonexistentTagsetError(f".tagset not found at {self.path}")
         try:
-            with open(self.path, "rb") as fp:
-                plist_data = plistlib.load(fp)
-                return plist_data
+            return _plist.read(self.path)
+        except FileNotFoundError as e:
+            raise NonexistentTagsetError(f".tagset not found at {self.path}") from e
         except Exception as e:
             raise CannotParseTagsetError(f"An error occurred: {e}") from e
 
-    def _write_plist(self):
+    def _write(self):
         """Write the tagset data to the .tagset plist file.
 
         Raises:
@@ -83,14 +81,22 @@ class Tagset:
                 - TypeError: If data contains non-serializable types.
         """
         try:
-            with open(self.path, "wb") as fp:
-                plistlib.dump(self.__raw_data, fp)
+            _plist.dump(self.path, self.__raw_data)
         except Exception as e:
             raise TagsetWriteError(f"An error occurred: {e}") from e
 
+        # The file is written with sorted keys; keep tags in that order so the
+        # in-memory data matches what a fresh load would return.
+        items = sorted(self.tags.items())
+        self.tags.clear()
+        self.tags.update(items)
+
     def load(self) -> "Tagset":
         """Load and parse the tagset file from disk.
 
+        Does nothing if the file's modification time and size are unchanged
+        since the last load or write by this instance.
+
         Returns:
             Tagset: Self for method chaining.
 
@@ -98,12 +104,22 @@ class Tagset:
             NonexistentTagsetError: If .tagset file doesn't exist (from _parse_plist).
             CannotParseTagsetError: If plist cannot be parsed (from _parse_plist).
         """
+        stamp = _plist.stamp(self.path)
+        if self._is_current(stamp):
+            return self
+
         self.__raw_data = self._parse_plist()
+        self._loaded(stamp)
 
         self.tags_id = self.path.name.removesuffix(".tagset")
         self.nickname = self.__raw_data.get("nickname")
         self.shortname = self.__raw_data.get("shortname")
-        self.tags = self.__raw_data.get("tags") or {}
+        self.tags = {
+            intern(tag): intern(value)
+            for tag, value in (self.__raw_data.get("tags") or {}).items()
+        }
+        if "tags" in self.__raw_data:
+            self.__raw_data["tags"] = self.tags
 
         return self
 
@@ -116,15 +132,15 @@ class Tagset:
         Raises:
             NonexistentTagsetError: If .tagset file doesn't exist (from load).
             CannotParseTagsetError: If plist cannot be parsed (from load).
-            TagsetWriteError: If writing fails (from _write_plist).
+            TagsetWriteError: If writing fails (from _write).
         """
-        self.load()
+        self._before_edit()
         if nickname is None:
             self.__raw_data.pop("nickname", None)
         else:
             self.__raw_data["nickname"] = nickname
-        self._write_plist()
-        self.load()
+        self.nickname = nickname
+        self._after_edit()
 
     def set_shortname(self, shortname: str | None):
         """Set or remove the shortname field in the tagset.
@@ -135,15 +151,15 @@ class Tagset:
         Raises:
             NonexistentTagsetError: If .tagset file doesn't exist (from load).
             CannotParseTagsetError: If plist cannot be parsed (from load).
-            TagsetWriteError: If writing fails (from _write_plist).
+            TagsetWriteError: If writing fails (from _write).
         """
-        self.load()
+        self._before_edit()
         if shortname is None:
             self.__raw_data.pop("shortname", None)
         else:
             self.__raw_data["shortname"] = shortname
-        self._write_plist()
-        self.load()
+        self.shortname = shortname
+        self._after_edit()
 
     def set_tags(self, tags: dict[str, str]):
         """Replace all tags with the provided dictionary.
@@ -154,12 +170,12 @@ class Tagset:
         Raises:
             NonexistentTagsetError: If .tagset file doesn't exist (from load).
             CannotParseTagsetError: If plist cannot be parsed (from load).
-            TagsetWriteError: If writing fails (from _write_plist).
+            TagsetWriteError: If writing fails (from _write).
         """
-        self.load()
-        self.__raw_data["tags"] = tags
-        self._write_plist()
-        self.load()
+        self._before_edit()
+        self.tags = {intern(tag): intern(value) for tag, value in tags.items()}
+        self.__raw_data["tags"] = self.tags
+        self._after_edit()
 
     def add_tag(self, tag: str, value: str):
         """Add or update a single tag.
@@ -171,12 +187,12 @@ class Tagset:
         Raises:
             NonexistentTagsetError: If .tagset file doesn't exist (from load).
             CannotParseTagsetError: If plist cannot be parsed (from load).
-            TagsetWriteError: If writing fails (from _write_plist).
+            TagsetWriteError: If writing fails (from _write).
         """
-        self.load()
-        self.tags[tag] = value
-        self._write_plist()
-        self.load()
+        self._before_edit()
+        self.tags[intern(tag)] = intern(value)
+        self.__raw_data["tags"] = self.tags
+        self._after_edit()
 
     def remove_tag(self, tag: str):
         """Remove a tag from the tagset.
@@ -188,12 +204,11 @@ class Tagset:
             NonexistentTagsetError: If .tagset file doesn't exist (from load).
             CannotParseTagsetError: If plist cannot be parsed (from load).
             KeyError: If tag doesn't exist in the tagset.
-            TagsetWriteError: If writing fails (from _write_plist).
+            TagsetWriteError: If writing fails (from _write).
         """
-        self.load()
+        self._before_edit()
         del self.tags[tag]
-        self._write_plist()
-        self.load()
+        self._after_edit()
 
     def move_to_tag(self, tag: str, value: str):
         """Clear all tags and set a single tag.
@@ -205,13 +220,13 @@ class Tagset:
         Raises:
             NonexistentTagsetError: If .tagset file doesn't exist (from load).
             CannotParseTagsetError: If plist cannot be parsed (from load).
-            TagsetWriteError: If writing fails (from _write_plist).
+            TagsetWriteError: If writing fails (from _write).
         """
-        self.load()
+        self._before_edit()
         self.tags.clear()
-        self.tags[tag] = value
-        self._write_plist()
-        self.load()
+        self.tags[intern(tag)] = intern(value)
+        self.__raw_data["tags"] = self.tags
+        self._after_edit()
 
 
 __all__ = ["Tagset"]
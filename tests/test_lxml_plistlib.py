@@ -0,0 +1,107 @@
+"""Round-trip checks for the lxml plist reader against plistlib."""
+
+import datetime
+import plistlib
+import unittest
+
+try:
+    from logic_plugin_manager import _lxml_plistlib
+except ImportError:
+    _lxml_plistlib = None
+
+
+@unittest.skipIf(_lxml_plistlib is None, "lxml is not installed")
+class LxmlPlistlibTest(unittest.TestCase):
+    def assertSameAsPlistlib(self, data: bytes):
+        self.assertEqual(
+            _lxml_plistlib.loads(data), plistlib.loads(data, fmt=plistlib.FMT_XML)
+        )
+
+    def assertBothReject(self, data: bytes, exception=plistlib.InvalidFileException):
+        with self.assertRaises(exception):
+            plistlib.loads(data, fmt=plistlib.FMT_XML)
+        with self.assertRaises(exception):
+            _lxml_plistlib.loads(data)
+
+    def test_round_trip(self):
+        value = {
+            "string": "Effects:EQ",
+            "empty": "",
+            "unicode": "Ünïcödé ✓ <&>",
+            "whitespace": "  padded\n\tvalue  ",
+            "integer": -42,
+            "big": 2**63 - 1,
+            "real": 0.1,
+            "true": True,
+            "false": False,
+            "data": b"\x00\x01binary\xff" * 20,
+            "date": datetime.datetime(2025, 10, 31, 12, 30, 5),
+            "array": [1, "two", [3.0], {"four": []}],
+            "dict": {"nested": {"deeper": {"k": "v"}}, "": "empty key"},
+            "AudioComponents": [
+                {"name": f"Vendor: Plugin {i}", "type": "aufx", "version": i}
+                for i in range(5)
+            ],
+        }
+        for root in (value, [value, value], "scalar root"):
+            with self.subTest(root=type(root).__name__):
+                data = plistlib.dumps(root, fmt=plistlib.FMT_XML)
+                self.assertEqual(_lxml_plistlib.loads(data), root)
+                self.assertSameAsPlistlib(data)
+
+    def test_hex_integer(self):
+        self.assertSameAsPlistlib(b"<plist><integer>0x1F</integer></plist>")
+
+    def test_partial_date(self):
+        self.assertSameAsPlistlib(b"<plist><date>2025-10-31T12Z</date></plist>")
+
+    def test_comments_and_processing_instructions(self):
+        self.assertSameAsPlistlib(
+            b"<plist><dict><key>a<!--x-->b</key>"
+            b"<string>ab<!--c-->cd<?pi x?>ef</string></dict></plist>"
+        )
+
+    def test_cdata_and_character_references(self):
+        self.assertSameAsPlistlib(
+            b"<plist><string>a&amp;&#65;<![CDATA[<x>]]>b</string></plist>"
+        )
+
+    def test_undeclared_entity_with_external_dtd(self):
+        self.assertSameAsPlistlib(
+            b'<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" '
+            b'"http://www.apple.com/DTDs/PropertyList-1.0.dtd">'
+            b"<plist><string>a&e;b</string></plist>"
+        )
+
+    def test_unknown_elements_ignored(self):
+        self.assertSameAsPlistlib(
+            b"<plist><dict><key>a</key><foo/><string>x</string></dict></plist>"
+        )
+        self.assertSameAsPlistlib(
+            b"<plist><array><foo>t<bar/></foo><string>a<foo>b</foo>c</string>"
+            b"</array></plist>"
+        )
+
+    def test_empty_key_followed_by_key(self):
+        self.assertSameAsPlistlib(
+            b"<plist><dict><key></key><key>b</key><string>x</string></dict></plist>"
+        )
+
+    def test_entity_declarations_rejected(self):
+        self.assertBothReject(
+            b'<!DOCTYPE plist [<!ENTITY e "zz">]>'
+            b"<plist><string>a&e;b</string></plist>"
+        )
+        self.assertBothReject(
+            b'<!DOCTYPE plist [<!ENTITY e "zz">]><plist><string>ab</string></plist>'
+        )
+
+    def test_malformed_structure_rejected(self):
+        self.assertBothReject(b"<plist><dict><key>a</key></dict></plist>", ValueError)
+        self.assertBothReject(
+            b"<plist><dict><string>a</string></dict></plist>", ValueError
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Edit, batch and reload behavior of the tag database files."""
+
+import plistlib
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from logic_plugin_manager import _plist
+from logic_plugin_manager.tags import Category, MusicApps, Tagset
+
+_SORTING = ["Effects", "Effects:EQ", "Instruments"]
+
+
+class TagsTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tags_path = Path(tmp.name)
+        self.dump("MusicApps.tagpool", {"": 0, **dict.fromkeys(_SORTING, 0)})
+        self.dump("MusicApps.properties", {"sorting": _SORTING, "user_sorted": True})
+        self.dump("plugin.tagset", {"nickname": "n", "tags": {"Effects": "user"}})
+
+    def dump(self, name: str, data: dict):
+        with open(self.tags_path / name, "wb") as fp:
+            plistlib.dump(data, fp)
+
+    def read(self, name: str) -> dict:
+        with open(self.tags_path / name, "rb") as fp:
+            return plistlib.load(fp)
+
+    def count_writes(self) -> mock.Mock:
+        patcher = mock.patch.object(_plist, "dump", wraps=_plist.dump)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+
+class BatchTest(TagsTestCase):
+    def test_batch_writes_once(self):
+        tagset = Tagset(self.tags_path / "plugin")
+        dump = self.count_writes()
+        with tagset.batch():
+            tagset.add_tag("Instruments", "user")
+            tagset.remove_tag("Effects")
+            tagset.set_nickname("nick")
+        self.assertEqual(dump.call_count, 1)
+        self.assertEqual(
+            self.read("plugin.tagset"),
+            {"nickname": "nick", "tags": {"Instruments": "user"}},
+        )
+
+    def test_batch_discards_edits_on_exception(self):
+        tagset = Tagset(self.tags_path / "plugin")
+        dump = self.count_writes()
+        with self.assertRaises(RuntimeError):
+            with tagset.batch():
+                tagset.add_tag("Instruments", "user")
+                tagset.set_nickname("nick")
+                raise RuntimeError
+        dump.assert_not_called()
+        self.assertEqual(tagset.tags, {"Effects": "user"})
+        self.assertEqual(tagset.nickname, "n")
+
+    def test_batch_reorder_rolls_back_on_unknown_operation(self):
+        properties = MusicApps(self.tags_path).properties
+        dump = self.count_writes()
+        with self.assertRaises(ValueError):
+            properties.batch_reorder(
+                [("move_to_top", "Instruments"), ("shuffle", "Effects")]
+            )
+        dump.assert_not_called()
+        self.assertEqual(properties.sorting, _SORTING)
+        self.assertEqual(properties.get_index("Instruments"), 2)
+
+
+class ReloadTest(TagsTestCase):
+    def test_unchanged_file_is_not_parsed_again(self):
+        tagset = Tagset(self.tags_path / "plugin")
+        with mock.patch.object(_plist, "read", wraps=_plist.read) as read:
+            tagset.load()
+            tagset.set_nickname("nick")
+            tagset.load()
+        read.assert_not_called()
+
+    def test_external_write_is_picked_up(self):
+        tagset = Tagset(self.tags_path / "plugin")
+        musicapps = MusicApps(self.tags_path)
+        tagset.load()
+        musicapps.properties.load()
+        self.dump("plugin.tagset", {"tags": {"Instruments": "user", "Effects": "x"}})
+        self.dump("MusicApps.properties", {"sorting": _SORTING[::-1]})
+        self.assertEqual(tagset.load().tags, {"Instruments": "user", "Effects": "x"})
+        self.assertEqual(musicapps.properties.load().sorting, _SORTING[::-1])
+
+    def test_shared_musicapps_revalidates(self):
+        musicapps = MusicApps.get(self.tags_path)
+        self.dump("MusicApps.tagpool", {"": 0, **dict.fromkeys(_SORTING, 7)})
+        self.assertIs(MusicApps.get(self.tags_path), musicapps)
+        self.assertEqual(musicapps.tagpool.categories["Effects"], 7)
+
+    def test_non_string_values_are_loaded(self):
+        self.dump("plugin.tagset", {"tags": {"Effects": 1}})
+        self.dump("MusicApps.properties", {"sorting": ["Effects", 2]})
+        self.assertEqual(Tagset(self.tags_path / "plugin").tags, {"Effects": 1})
+        self.assertEqual(MusicApps(self.tags_path).properties.sorting, ["Effects", 2])
+
+
+class CategoryTest(TagsTestCase):
+    def test_position_refreshes_after_sibling_moves(self):
+        musicapps = MusicApps(self.tags_path)
+        eq = Category("Effects:EQ", musicapps=musicapps)
+        effects = Category("Effects", musicapps=musicapps)
+        instruments = Category("Instruments", musicapps=musicapps)
+        self.assertEqual(eq.index, 1)
+        self.assertTrue(effects.is_first)
+        self.assertEqual(
+            [neighbor.name for neighbor in eq.neighbors], ["Effects", "Instruments"]
+        )
+
+        instruments.move_to_top()
+        self.assertEqual(eq.index, 2)
+        self.assertTrue(eq.is_last)
+        self.assertFalse(effects.is_first)
+        self.assertEqual(
+            [neighbor.name for neighbor in effects.neighbors],
+            ["Instruments", "Effects:EQ"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()